@@ -11,7 +11,7 @@
 import click
 
 from ..commands import AssetsCommands
-from .utils import pass_cli_config, run_steps
+from .utils import pass_cli_config, run_steps, secho_progress
 
 
 @click.group()
@@ -60,7 +60,7 @@ def install(cli_config, path):
     """Install and link a React module on the local installation."""
     commands = AssetsCommands(cli_config)
 
-    click.secho("Installing React module...", fg="green")
+    secho_progress("Installing React module...", fg="green")
     steps = commands.link_js_module(path)
     on_fail = "Failed to install React module."
     on_success = "React module installed successfully."
@@ -86,7 +86,7 @@ def watch_assets(cli_config):
 def watch_module(cli_config, path, link):
     """Watch a React module on the local installation."""
     commands = AssetsCommands(cli_config)
-    click.secho("Watching React module...", fg="green")
+    secho_progress("Watching React module...", fg="green")
     steps = commands.watch_js_module(path, link=link)
     on_fail = "Failed set watcher on React module."
     on_success = "Finished watching React module."
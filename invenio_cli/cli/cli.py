@@ -32,18 +32,28 @@ from .packages import packages
 from .services import services
 from .translations import translations
 from .utils import (
+    QUIET_META_KEY,
     combine_decorators,
     handle_process_response,
     pass_cli_config,
     run_steps,
+    secho_progress,
 )
 
 
 @click.group()
 @click.version_option()
+@click.option(
+    "--quiet",
+    "-q",
+    default=False,
+    is_flag=True,
+    help="Only show warnings and errors of the executed steps.",
+)
 @click.pass_context
-def invenio_cli(ctx):
+def invenio_cli(ctx, quiet):
     """Initialize CLI context."""
+    ctx.meta[QUIET_META_KEY] = quiet
 
 
 invenio_cli.add_command(assets)
@@ -64,7 +74,7 @@ invenio_cli.add_command(translations)
 )
 def check_requirements(development):
     """Checks the system fulfills the pre-requirements."""
-    click.secho("Checking pre-requirements...", fg="green")
+    secho_progress("Checking pre-requirements...", fg="green")
     steps = RequirementsCommands.check(development)
     on_fail = "Pre requisites not met."
     on_success = "All requisites are fulfilled."
@@ -119,7 +129,7 @@ def pyshell(cli_config, debug):
 )
 def init(flavour, template, checkout, user_input, config):
     """Initializes the application according to the chosen flavour."""
-    click.secho(
+    secho_progress(
         "Initializing {flavour} application...".format(flavour=flavour), fg="green"
     )
 
@@ -132,14 +142,14 @@ def init(flavour, template, checkout, user_input, config):
     cookiecutter_wrapper = CookiecutterWrapper(flavour, **cookiecutter_kwargs)
 
     try:
-        click.secho("Running cookiecutter...", fg="green")
+        secho_progress("Running cookiecutter...", fg="green")
         project_dir = cookiecutter_wrapper.cookiecutter()
 
-        click.secho("Writing invenio-cli config files...", fg="green")
+        secho_progress("Writing invenio-cli config files...", fg="green")
         saved_replay = cookiecutter_wrapper.get_replay()
         CLIConfig.write(project_dir, flavour, saved_replay)
 
-        click.secho("Creating logs directory...", fg="green")
+        secho_progress("Creating logs directory...", fg="green")
         os.mkdir(Path(project_dir) / "logs")
 
     except Exception as e:
@@ -295,7 +305,7 @@ def destroy(cli_config):
     """Removes all associated resources (containers, images, volumes)."""
     commands = Commands(cli_config)
     services = ContainersCommands(cli_config)
-    click.secho("Destroying containers, volumes, virtual environment...", fg="green")
+    secho_progress("Destroying containers, volumes, virtual environment...", fg="green")
     steps = commands.destroy()  # Destroy virtual environment
     steps.extend(services.destroy())  # Destroy services
     on_fail = (
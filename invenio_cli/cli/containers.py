@@ -12,7 +12,7 @@ import click
 
 from ..commands import ContainersCommands
 from .services import status as services_status_cmd
-from .utils import pass_cli_config, run_steps
+from .utils import pass_cli_config, run_steps, secho_progress
 
 
 @click.group()
@@ -37,7 +37,7 @@ def containers():
 def build(cli_config, pull, cache):
     """Build application and service images."""
     commands = ContainersCommands(cli_config)
-    click.secho(
+    secho_progress(
         f"Building images... Pull newer versions {pull}, use cache {cache}", fg="green"
     )
     steps = commands.build(pull, cache)
@@ -78,7 +78,7 @@ def setup(cli_config, force, no_demo_data, stop_services, services):
     # no_demo_data = False (default) means "YES to demo_data"
     demo_data = not no_demo_data
     commands = ContainersCommands(cli_config)
-    click.secho(
+    secho_progress(
         f"Setting up services with force {force}, demo data {demo_data} "
         + f"and stop after setup {stop_services}...",
         fg="green",
@@ -116,6 +116,13 @@ def status(ctx, verbose):
     is_flag=True,
     help="Lock Python dependencies (default=False).",
 )
+@click.option(
+    "--force-lock",
+    default=False,
+    is_flag=True,
+    help="Lock even if the lock file is newer than the dependencies manifest "
+    + "(default=False), requires --lock.",
+)
 @click.option(
     "--build/--no-build",
     default=False,
@@ -142,11 +149,11 @@ def status(ctx, verbose):
     help="Enable/disable dockerized services (default: enabled).",
 )
 @pass_cli_config
-def start(cli_config, lock, build, setup, demo_data, services):
+def start(cli_config, lock, force_lock, build, setup, demo_data, services):
     """Start containerized services and application."""
     commands = ContainersCommands(cli_config)
-    click.secho("Starting InvenioRDM instance...")
-    steps = commands.start(lock, build, setup, demo_data, services)
+    secho_progress("Starting InvenioRDM instance...")
+    steps = commands.start(lock, build, setup, demo_data, services, force_lock)
     on_fail = "Failed to start containerized instance."
     on_success = "Instance running!\nVisit https://127.0.0.1"
 
@@ -170,7 +177,7 @@ def stop(cli_config):
 def destroy(cli_config):
     """Destroy containerized services and application."""
     commands = ContainersCommands(cli_config)
-    click.secho("Destroying containers, volumes, virtual environment...", fg="green")
+    secho_progress("Destroying containers, volumes, virtual environment...", fg="green")
     steps = commands.destroy()
     on_fail = "Failed to destroy instance's containers."
     on_success = "Instance' containers destroyed."
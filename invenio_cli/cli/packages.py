@@ -12,7 +12,7 @@ import click
 
 from ..commands import AssetsCommands, PackagesCommands
 from ..helpers.versions import _parse_version
-from .utils import pass_cli_config, run_steps
+from .utils import pass_cli_config, run_steps, secho_progress
 
 
 @click.group()
@@ -30,7 +30,7 @@ def packages():
 @pass_cli_config
 def lock(cli_config, pre, dev):
     """Lock Python dependencies."""
-    click.secho(
+    secho_progress(
         f"Locking dependencies... Allow pre-releases: {pre}. "
         + f"Include dev-packages: {dev}.",
         fg="green",
@@ -68,7 +68,7 @@ def install(cli_config, packages, skip_build, pip_log_file, node_log_file):
 
     # FIXME: Migrate assets to steps.
     if not skip_build:
-        click.secho("Rebuilding assets...")
+        secho_progress("Rebuilding assets...")
         AssetsCommands(cli_config).update_statics_and_assets(
             force=True, debug=True, log_file=node_log_file
         )
@@ -7,11 +7,10 @@
 
 """Invenio module to ease the creation and management of applications."""
 
-
 import click
 
 from ..commands import ServicesCommands
-from .utils import pass_cli_config, run_steps
+from .utils import pass_cli_config, run_steps, secho_progress
 
 
 @click.group()
@@ -23,7 +22,7 @@ def services():
 @pass_cli_config
 def start(cli_config):
     """Start local services."""
-    click.secho("Starting containers...", fg="green")
+    secho_progress("Starting containers...", fg="green")
     commands = ServicesCommands(cli_config)
     steps = commands.start()
     on_fail = "Failed to start services."
@@ -122,7 +121,7 @@ def stop(cli_config):
 def destroy(cli_config):
     """Destroy development services."""
     commands = ServicesCommands(cli_config)
-    click.secho("Destroying services' containers, volumes...", fg="green")
+    secho_progress("Destroying services' containers, volumes...", fg="green")
     steps = commands.destroy()
     on_fail = "Failed to destroy services' containers."
     on_success = "Services' containers destroyed."
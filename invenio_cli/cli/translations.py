@@ -12,7 +12,7 @@ from pathlib import Path
 import click
 
 from ..commands import TranslationsCommands
-from .utils import pass_cli_config, run_steps
+from .utils import pass_cli_config, run_steps, secho_progress
 
 
 @click.group()
@@ -30,7 +30,7 @@ def translations():
 @pass_cli_config
 def extract(cli_config, babel_ini):
     """Extract messages for i18n support (translations)."""
-    click.secho("Extracting messages...", fg="green")
+    secho_progress("Extracting messages...", fg="green")
     steps = TranslationsCommands(cli_config).extract(
         msgid_bugs_address=cli_config.get_author_email(),
         copyright_holder=cli_config.get_author_name(),
@@ -49,7 +49,7 @@ def extract(cli_config, babel_ini):
 @pass_cli_config
 def init(cli_config, locale):
     """Initialized message catalog for a given locale."""
-    click.secho("Initializing messages catalog...", fg="green")
+    secho_progress("Initializing messages catalog...", fg="green")
     steps = TranslationsCommands(cli_config).init(
         output_dir=cli_config.get_project_dir() / Path("translations/"),
         input_file=cli_config.get_project_dir() / Path("translations/messages.pot"),
@@ -65,7 +65,7 @@ def init(cli_config, locale):
 @pass_cli_config
 def update(cli_config):
     """Update messages catalog."""
-    click.secho("Updating messages catalog...", fg="green")
+    secho_progress("Updating messages catalog...", fg="green")
     steps = TranslationsCommands(cli_config).update(
         output_dir=cli_config.get_project_dir() / Path("translations/"),
         input_file=cli_config.get_project_dir() / Path("translations/messages.pot"),
@@ -81,7 +81,7 @@ def update(cli_config):
 @pass_cli_config
 def compile(cli_config, fuzzy):
     """Compile message catalog."""
-    click.secho("Compiling catalog...", fg="green")
+    secho_progress("Compiling catalog...", fg="green")
     commands = TranslationsCommands(
         cli_config,
         project_path=cli_config.get_project_dir(),
@@ -10,6 +10,7 @@
 import click
 
 from ..helpers.cli_config import CLIConfig
+from ..helpers.output import QUIET_META_KEY, is_quiet, secho_progress
 
 pass_cli_config = click.make_pass_decorator(CLIConfig, ensure=True)
 
@@ -17,11 +18,11 @@ pass_cli_config = click.make_pass_decorator(CLIConfig, ensure=True)
 def run_steps(steps, fail_message, success_message):
     """Run a series of steps."""
     for step in steps:
-        click.secho(message=step.message, fg="green")
+        secho_progress(step.message, fg="green")
         response = step.execute()
         handle_process_response(response, fail_message=fail_message)
     else:
-        click.secho(message=success_message, fg="green")
+        secho_progress(success_message, fg="green")
 
 
 def handle_process_response(response, fail_message=None):
@@ -38,7 +39,7 @@ def handle_process_response(response, fail_message=None):
             msg = fail_message + "\n" + msg
 
         click.secho(msg, fg="red")
-        exit(1)
+        click.get_current_context().exit(1)
     elif response.warning:
         if response.error:
             msg = f"Errors: {response.error}"
@@ -47,7 +48,7 @@ def handle_process_response(response, fail_message=None):
 
         click.secho(msg, fg="yellow")
     elif response.output:
-        click.secho(message=response.output, fg="green")
+        secho_progress(response.output, fg="green")
 
 
 def combine_decorators(*decorators):
@@ -9,9 +9,8 @@
 
 from pathlib import Path
 
-import click
-
 from ..helpers import env
+from ..helpers.output import secho_progress
 from ..helpers.process import ProcessResponse, run_interactive
 from .local import LocalCommands
 from .steps import FunctionStep
@@ -35,7 +34,7 @@ class AssetsCommands(LocalCommands):
 
     def _watch_js_module(self, pkg):
         """Watch the JS module for changes."""
-        click.secho("Starting watching module...", fg="green")
+        secho_progress("Starting watching module...", fg="green")
         status_code = pkg.run_script("watch")
         if status_code == 0:
             return ProcessResponse(output="Watched module successfully.", status_code=0)
@@ -85,7 +84,7 @@ class AssetsCommands(LocalCommands):
 
         with env(FLASK_DEBUG="1"):
             # Collect into statics/ and assets/ folder
-            click.secho(
+            secho_progress(
                 "Starting assets watching (press CTRL+C to stop)...", fg="green"
             )
             run_interactive(watch_cmd, env={"PIPENV_VERBOSITY": "-1"})
@@ -9,8 +9,7 @@
 
 
 from ..helpers.cli_config import CLIConfig
-from ..helpers.env import env
-from ..helpers.process import run_interactive
+from ..helpers.process import replace_process
 from .steps import CommandStep
 
 
@@ -25,16 +24,24 @@ class Commands(object):
         self.cli_config = cli_config
 
     def shell(self):
-        """Start a shell in the virtual environment."""
+        """Start a shell in the virtual environment.
+
+        The shell replaces the current process, this method does not return.
+        """
         command = self.cli_config.python_package_manager.start_activated_subshell()
-        return run_interactive(command, env={"PIPENV_VERBOSITY": "-1"})
+        replace_process(command, env={"PIPENV_VERBOSITY": "-1"})
 
     def pyshell(self, debug=False):
-        """Start a Python shell."""
+        """Start a Python shell.
+
+        The shell replaces the current process, this method does not return.
+        """
         pkg_man = self.cli_config.python_package_manager
-        with env(FLASK_DEBUG="1" if debug else "0"):
-            command = pkg_man.run_command("invenio", "shell")
-            return run_interactive(command, env={"PIPENV_VERBOSITY": "-1"})
+        command = pkg_man.run_command("invenio", "shell")
+        replace_process(
+            command,
+            env={"PIPENV_VERBOSITY": "-1", "FLASK_DEBUG": "1" if debug else "0"},
+        )
 
     def destroy(self):
         """Destroys the instance's virtualenv.
@@ -27,27 +27,40 @@ class ContainersCommands(ServicesCommands):
 
         super().__init__(cli_config, docker_helper)
 
-    def build(self, pull=True, cache=True):
+    def build(self, pull=True, cache=True, pull_services=True):
         """Return the steps to build images.
 
         :param pull: Attempt to pull newer versions of the images.
         :param cache: Use cached images and layers.
+        :param pull_services: Pull the services' images too, requires pull.
         """
         steps = [
             FunctionStep(
                 func=lambda: PackagesCommands(self.cli_config).is_locked(),
                 message="Checking if dependencies are locked.",
             ),
+        ]
+
+        if pull and pull_services:
+            steps.append(
+                FunctionStep(
+                    func=self.docker_helper.pull_images,
+                    message="Pulling services' images...",
+                    skippable=True,
+                )
+            )
+
+        steps.append(
             FunctionStep(
                 func=self.docker_helper.build_images,
                 args={"pull": pull, "cache": cache},
                 message="Building images...",
-            ),
-        ]
+            )
+        )
 
         return steps
 
-    def _cleanup(self, project_shortname="/opt/var/instance/"):
+    def _cleanup(self, project_shortname):
         """Steps to cleanup commands."""
         steps = [
             FunctionStep(
@@ -91,7 +104,7 @@ class ContainersCommands(ServicesCommands):
 
         return steps
 
-    def _setup(self, project_shortname="/opt/var/instance/"):
+    def _setup(self, project_shortname):
         """Steps to initialize services."""
         steps = [
             FunctionStep(
@@ -298,12 +311,28 @@ class ContainersCommands(ServicesCommands):
 
         return steps
 
+    def _wait_for_images_pull(self):
+        """Step to wait for the images pulled in the background."""
+        # NOTE: Skippable, compose pulls any missing image when starting up
+        return FunctionStep(
+            func=self.docker_helper.wait_for_images_pull,
+            message="Waiting for images to be pulled...",
+            skippable=True,
+        )
+
     def start(
-        self, lock=False, build=False, setup=False, demo_data=True, services=True
+        self,
+        lock=False,
+        build=False,
+        setup=False,
+        demo_data=True,
+        services=True,
+        force_lock=False,
     ):
         """Return the steps to start service and application containers.
 
         :param lock: Lock dependencies.
+        :param force_lock: Lock even if the lock file is up to date.
         :param build: Build containers if not built.
         :param setup: Setup services (db, indices, etc.).
         :param demo_data: Include demo records.
@@ -311,25 +340,57 @@ class ContainersCommands(ServicesCommands):
                          This option is incompatible will all the other flags.
         """
         steps = []
+        setup = services and setup
+
+        # NOTE: Locking is network bound, download the images meanwhile. Only
+        # when the lock file is actually regenerated, and not when the `up`
+        # below already pulls them (build without setup).
+        packages = PackagesCommands(self.cli_config)
+        relock = lock and (force_lock or not packages.is_lock_up_to_date())
+        pull_meanwhile = relock and (setup or not build)
 
+        if pull_meanwhile:
+            steps.append(
+                FunctionStep(
+                    func=self.docker_helper.pull_images_in_background,
+                    message="Pulling images in the background...",
+                    skippable=True,
+                )
+            )
         if lock:
             # FIXME: Should this params be accepted? sensible defaults?
-            steps.extend(PackagesCommands(self.cli_config).lock(pre=True, dev=True))
-
-        if build:
-            steps.extend(self.build())
-
-        if services and setup:
+            steps.extend(packages.lock(pre=True, dev=True, force=relock))
+
+        if setup:
+            if build:
+                # NOTE: The services' images may already be being pulled
+                steps.extend(self.build(pull_services=not pull_meanwhile))
+            if pull_meanwhile:
+                steps.append(self._wait_for_images_pull())
             # NOTE: Setup will boot up all service and not bring down
             steps.extend(self.setup(force=True, demo_data=demo_data))
             return steps
 
+        if build:
+            # NOTE: Images are built (pulling newer base images, as `build`
+            # does by default) by the same `up` call that starts the
+            # containers, so the compose project is only loaded once.
+            steps.append(
+                FunctionStep(
+                    func=lambda: PackagesCommands(self.cli_config).is_locked(),
+                    message="Checking if dependencies are locked.",
+                )
+            )
+
+        if pull_meanwhile:
+            steps.append(self._wait_for_images_pull())
+
         # NOTE: Needed in case there is no setup
         steps.append(
             FunctionStep(
                 func=self.docker_helper.start_containers,
-                args={"app_only": not services},
-                message="Checking if dependencies are locked.",
+                args={"app_only": not services, "build": build, "pull": build},
+                message="Starting containers...",
             )
         )
 
@@ -10,7 +10,6 @@
 
 import os
 import signal
-from distutils.dir_util import copy_tree
 from os import environ
 from pathlib import Path
 from subprocess import Popen as popen
@@ -18,6 +17,7 @@ from subprocess import Popen as popen
 import click
 
 from ..helpers import env, filesystem
+from ..helpers.output import secho_progress
 from ..helpers.process import ProcessResponse, run_interactive
 from ..helpers.versions import rdm_version
 from .commands import Commands
@@ -29,11 +29,12 @@ class LocalCommands(Commands):
     def __init__(self, cli_config):
         """Constructor."""
         super().__init__(cli_config)
+        self._processes = []
 
     def _symlink_assets_templates(self, files_to_link):
         """Symlink the assets folder."""
         assets = "assets"
-        click.secho("Symlinking {}...".format(assets), fg="green")
+        secho_progress("Symlinking {}...".format(assets), fg="green")
 
         instance_path = self.cli_config.get_instance_path()
         project_dir = self.cli_config.get_project_dir()
@@ -45,7 +46,10 @@ class LocalCommands(Commands):
 
     def _copy_statics_and_assets(self):
         """Copy project's statics and assets into instance dir."""
-        click.secho("Copying project statics and assets...", fg="green")
+        # NOTE: Imported here, distutils is slow to import
+        from distutils.dir_util import copy_tree
+
+        secho_progress("Copying project statics and assets...", fg="green")
 
         # static and assets folders do not exist in non-RDM contexts
         rdm_static_dir_exists = os.path.exists("static")
@@ -108,7 +112,7 @@ class LocalCommands(Commands):
                     response = op()
                 else:
                     if op[-1] in messages:
-                        click.secho(messages[op[-1]], fg="green")
+                        secho_progress(messages[op[-1]], fg="green")
                     response = run_interactive(
                         op,
                         env={"PIPENV_VERBOSITY": "-1", **js_pkg_man.env_overrides()},
@@ -119,21 +123,29 @@ class LocalCommands(Commands):
         return response
 
     def _handle_sigint(self, name, process):
-        """Terminate services on SIGINT."""
-        prev_handler = signal.getsignal(signal.SIGINT)
+        """Terminate services on SIGINT.
+
+        A single handler is installed, which stops all the processes started
+        by this object (most recent first).
+        """
+        if not self._processes:
+            prev_handler = signal.getsignal(signal.SIGINT)
+
+            def _signal_handler(sig, frame):
+                for name, process in reversed(self._processes):
+                    secho_progress(f"Stopping {name}...", fg="green")
+                    process.terminate()
+                    secho_progress(f"{name} stopped...", fg="green")
+                if callable(prev_handler):
+                    prev_handler(sig, frame)
 
-        def _signal_handler(sig, frame):
-            click.secho(f"Stopping {name}...", fg="green")
-            process.terminate()
-            click.secho(f"{name} stopped...", fg="green")
-            if prev_handler is not None:
-                prev_handler(sig, frame)
+            signal.signal(signal.SIGINT, _signal_handler)
 
-        signal.signal(signal.SIGINT, _signal_handler)
+        self._processes.append((name, process))
 
     def run_web(self, host, port, debug=True):
         """Run development server."""
-        click.secho("Starting up local (development) server...", fg="green")
+        secho_progress("Starting up local (development) server...", fg="green")
         run_env = environ.copy()
         run_env["FLASK_DEBUG"] = "1" if debug else "0"
         run_env["INVENIO_SITE_UI_URL"] = f"https://{host}:{port}"
@@ -157,14 +169,14 @@ class LocalCommands(Commands):
             env=run_env,
         )
         self._handle_sigint("Web server", proc)
-        click.secho(f"Instance running!\nVisit https://{host}:{port}", fg="green")
+        secho_progress(f"Instance running!\nVisit https://{host}:{port}", fg="green")
         return [proc]
 
     def run_worker(
         self, celery_log_file=None, celery_log_level="INFO", jobs_scheduler=True
     ):
         """Run Celery worker."""
-        click.secho("Starting celery worker...", fg="green")
+        secho_progress("Starting celery worker...", fg="green")
 
         pkg_man = self.cli_config.python_package_manager
         celery_command = pkg_man.run_command(
@@ -189,7 +201,7 @@ class LocalCommands(Commands):
         processes = []
         proc = popen(celery_command)
         self._handle_sigint("Celery worker", proc)
-        click.secho("Worker running!", fg="green")
+        secho_progress("Worker running!", fg="green")
         processes.append(proc)
 
         if jobs_scheduler:
@@ -211,7 +223,7 @@ class LocalCommands(Commands):
         elif version[0] < 13:
             return []
 
-        click.secho("Starting jobs scheduler...", fg="green")
+        secho_progress("Starting jobs scheduler...", fg="green")
 
         pkg_man = self.cli_config.python_package_manager
         beat_command = pkg_man.run_command(
@@ -233,7 +245,7 @@ class LocalCommands(Commands):
 
         proc = popen(beat_command)
         self._handle_sigint("Jobs scheduler", proc)
-        click.secho("Jobs scheduler running!", fg="green")
+        secho_progress("Jobs scheduler running!", fg="green")
         return [proc]
 
     def run_all(
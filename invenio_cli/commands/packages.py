@@ -8,11 +8,11 @@
 
 """Invenio module to ease the creation and management of applications."""
 
-from os import listdir
+from os import listdir, stat
 
 from ..helpers.cli_config import CLIConfig
 from ..helpers.process import ProcessResponse
-from .steps import CommandStep
+from .steps import CommandStep, FunctionStep
 
 
 class PackagesCommands(object):
@@ -93,8 +93,22 @@ class PackagesCommands(object):
 
         return steps
 
-    def lock(self, pre, dev):
-        """Steps to lock Python dependencies."""
+    def lock(self, pre, dev, force=True):
+        """Steps to lock Python dependencies.
+
+        :param force: Lock even if the lock file is newer than the manifest.
+        """
+        if not force and self.is_lock_up_to_date():
+            return [
+                FunctionStep(
+                    func=lambda: ProcessResponse(
+                        output="Lock file is up to date, skipping locking.",
+                        status_code=0,
+                    ),
+                    message="Locking python dependencies...",
+                )
+            ]
+
         cmd = self.cli_config.python_package_manager.lock_dependencies(pre, dev)
         steps = [
             CommandStep(
@@ -122,3 +136,14 @@ class PackagesCommands(object):
             output="Dependencies are locked",
             status_code=0,
         )
+
+    def is_lock_up_to_date(self):
+        """Checks if the lock file is newer than the dependencies manifest."""
+        pkg_man = self.cli_config.python_package_manager
+        try:
+            lock_mtime = stat(pkg_man.lock_file_name).st_mtime
+            manifest_mtime = stat(pkg_man.manifest_file_name).st_mtime
+        except FileNotFoundError:
+            return False
+
+        return lock_mtime >= manifest_mtime
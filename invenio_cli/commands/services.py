@@ -15,6 +15,7 @@ from invenio_cli.commands.translations import TranslationsCommands
 from invenio_cli.helpers.env import env
 
 from ..helpers.docker_helper import DockerHelper
+from ..helpers.output import secho_progress
 from ..helpers.process import ProcessResponse
 from ..helpers.versions import ils_version, rdm_version
 from .commands import Commands
@@ -42,7 +43,9 @@ class ServicesCommands(Commands):
             cmd_env = {"INSTANCE_PATH": str(instance_path)}
         # Set environment variable for the instance path, it might be needed by docker services
         with env(**cmd_env):
-            self.docker_helper.start_containers()
+            # NOTE: `up` is not needed when the services are already running
+            if not self.docker_helper.containers_up_to_date():
+                self.docker_helper.start_containers()
 
         services = ["redis", self.cli_config.get_db_type(), "search"]
         for service in services:
@@ -63,7 +66,7 @@ class ServicesCommands(Commands):
                 # We should not use `click` outside the `cli` context, but
                 # the return signature of this method does not support a list
                 # of `ProcessResponse` objs, so it is printed directly here.
-                click.secho(f"{service} up and running!", fg="green")
+                secho_progress(f"{service} up and running!", fg="green")
 
         return ProcessResponse(
             output="Containers started and healthy.",
@@ -137,7 +140,7 @@ class ServicesCommands(Commands):
         file_storage = self.cli_config.get_file_storage()
         if file_storage == "local":
             return "{}/data".format(self.cli_config.get_instance_path())
-        return "{}://default".format(self.cli_config.get_file_storage().lower())
+        return "{}://default".format(file_storage.lower())
 
     def _setup(self, demo_data=False):
         """Services initialization steps."""
@@ -10,6 +10,7 @@
 
 """Invenio-cli configuration file."""
 
+import os
 from configparser import ConfigParser
 from functools import cached_property
 from pathlib import Path
@@ -26,6 +27,12 @@ from .package_managers import (
 )
 from .process import ProcessResponse
 
+# Parsed general config files, keyed by absolute path and stored along with
+# the mtime (in ns) they were parsed at. The `.invenio` file is never written
+# by CLIConfig instances, so the parsed object can be shared until the file
+# changes on disk.
+_CONFIG_CACHE = {}
+
 
 class CLIConfig(object):
     """Invenio-cli configuration.
@@ -50,25 +57,35 @@ class CLIConfig(object):
         """
         self.project_path = Path(project_dir)
         self.config_path = self.project_path / self.CONFIG_FILENAME
-        self.config = ConfigParser()
+        self.config = self._read_config(self.config_path)
         self.private_config_path = self.project_path / self.PRIVATE_CONFIG_FILENAME
         self.private_config = ConfigParser()
 
         try:
-            with open(self.config_path) as cfg_file:
-                self.config.read_file(cfg_file)
+            with open(self.private_config_path) as cfg_file:
+                self.private_config.read_file(cfg_file)
+        except FileNotFoundError:
+            self.private_config = CLIConfig._write_private_config(Path(project_dir))
+
+    @staticmethod
+    def _read_config(config_path):
+        """Return the parsed general config file, reusing cached parses."""
+        try:
+            stat = os.stat(config_path)
         except FileNotFoundError as e:
             raise InvenioCLIConfigError(
                 f"Missing '{e.filename}' file in current directory. Are you in the project folder?",  # noqa
             )
 
-        try:
-            with open(self.private_config_path) as cfg_file:
-                self.private_config.read_file(cfg_file)
-        except FileNotFoundError:
-            CLIConfig._write_private_config(Path(project_dir))
-            with open(self.private_config_path) as cfg_file:
-                self.private_config.read_file(cfg_file)
+        path = os.path.abspath(config_path)
+        mtime, config = _CONFIG_CACHE.get(path, (None, None))
+        if mtime != stat.st_mtime_ns:
+            config = ConfigParser()
+            with open(config_path) as cfg_file:
+                config.read_file(cfg_file)
+            _CONFIG_CACHE[path] = (stat.st_mtime_ns, config)
+
+        return config
 
     @cached_property
     def python_package_manager(self) -> PythonPackageManager:
@@ -84,7 +101,7 @@ class CLIConfig(object):
         elif (self.project_path / "pyproject.toml").is_file():
             return UV()
         else:
-            raise RuntimeError(
+            raise InvenioCLIConfigError(
                 "Could not determine the Python package manager, please configure it."
             )
 
@@ -202,7 +219,10 @@ class CLIConfig(object):
 
     @classmethod
     def _write_private_config(cls, project_dir):
-        """Write per-instance config file."""
+        """Write per-instance config file.
+
+        :return: the written ConfigParser, so callers need not read it back.
+        """
         config_parser = ConfigParser()
         config_parser[cls.CLI_SECTION] = {}
         config_parser[cls.CLI_SECTION]["services_setup"] = str(False)
@@ -210,6 +230,8 @@ class CLIConfig(object):
         with open(private_config_path, "w") as configfile:
             config_parser.write(configfile)
 
+        return config_parser
+
     @classmethod
     def write(cls, project_dir, flavour, replay):
         """Write invenio-cli config files.
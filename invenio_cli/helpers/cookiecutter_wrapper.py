@@ -13,13 +13,23 @@
 import tempfile
 from configparser import ConfigParser
 
-import yaml
-from cookiecutter import replay
-from cookiecutter.config import DEFAULT_CONFIG
-from cookiecutter.main import cookiecutter
-
 from .cli_config import CLIConfig
 
+# NOTE: cookiecutter (and yaml) are imported where used, they are only needed
+# by `invenio-cli init` and are slow to import.
+
+# Default template and checkout (branch, tag or commit) per flavour
+FLAVOUR_TEMPLATES = {
+    "RDM": (
+        "https://github.com/inveniosoftware/cookiecutter-invenio-rdm.git",
+        "v12.0",
+    ),
+    "ILS": (
+        "https://github.com/inveniosoftware/cookiecutter-invenio-ils.git",
+        "v1.0.0rc.1",
+    ),
+}
+
 
 class CookiecutterWrapper(object):
     """Cookiecutter helper object for InvenioCLI."""
@@ -60,24 +70,17 @@ class CookiecutterWrapper(object):
             # load values to be passed to cookiecutter from an .invenio file
             self.replay = dict(config[CLIConfig.COOKIECUTTER_SECTION].items())
 
-        if self.flavour.upper() == "RDM":
-            self.template = (
-                self.template_name
-                or "https://github.com/inveniosoftware/cookiecutter-invenio-rdm.git"
-            )
-            self.template_name = self.extract_template_name(self.template)
-            self.checkout = self.checkout or "v12.0"
-
-        if self.flavour.upper() == "ILS":
-            self.template = (
-                self.template_name
-                or "https://github.com/inveniosoftware/cookiecutter-invenio-ils.git"
-            )
+        defaults = FLAVOUR_TEMPLATES.get(self.flavour.upper())
+        if defaults:
+            default_template, default_checkout = defaults
+            self.template = self.template_name or default_template
             self.template_name = self.extract_template_name(self.template)
-            self.checkout = self.checkout or "v1.0.0rc.1"
+            self.checkout = self.checkout or default_checkout
 
     def cookiecutter(self):
         """Wrap cookiecutter call."""
+        from cookiecutter.main import cookiecutter
+
         # build actual kwargs
         cookiecutter_kwargs = {
             "template": self.template,
@@ -95,6 +98,9 @@ class CookiecutterWrapper(object):
 
     def create_and_dump_config_file(self):
         """Create a tmp file to store used configuration."""
+        import yaml
+        from cookiecutter.config import DEFAULT_CONFIG
+
         if not self.tmp_file:
             self.tmp_file = tempfile.NamedTemporaryFile(mode="w+")
 
@@ -114,5 +120,7 @@ class CookiecutterWrapper(object):
 
     def get_replay(self):
         """Retrieve dict of user input values."""
+        from cookiecutter import replay
+
         if self.template_name:
             return replay.load(tempfile.gettempdir(), self.template_name)
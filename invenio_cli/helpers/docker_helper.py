@@ -11,25 +11,109 @@
 
 """Invenio CLI Docker Compose class."""
 
+import atexit
+import hashlib
+import json
+import os
 import re
-
-import docker
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from subprocess import DEVNULL, PIPE
+from subprocess import Popen as popen
 
 from .process import ProcessResponse, run_cmd, run_interactive
+from .versions import _parse_version
 
 DOCKER_COMPOSE_VERSION_DASH = "1.21.0"
+CACHE_DIRNAME = "invenio-cli"
+
+_COMPOSE_VARIABLE_RE = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)")
+
+_docker_client = None
+
+
+def get_docker_client():
+    """Return the docker client shared by all DockerHelper instances.
+
+    Creating a client opens a connection to the daemon and negotiates the
+    API version, so it is done once per process and only when needed.
+    """
+    global _docker_client
+    if _docker_client is None:
+        # NOTE: Imported here, it is slow and not needed by most commands
+        import docker
+
+        _docker_client = docker.from_env()
+    return _docker_client
+
+
+def _cache_path(name):
+    """Return the path of a per project file in the user's cache directory.
+
+    Files are kept out of the project, so that they are neither versioned nor
+    part of the docker build context.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    project = hashlib.sha256(os.getcwd().encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_home, CACHE_DIRNAME, f"{name}-{project}.json")
+
+
+def _read_json(path):
+    """Read a JSON file, an empty dict if it is missing or invalid."""
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_private_json(path, data):
+    """Write `data` as JSON to a file only readable by the user."""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as cache_file:
+        json.dump(data, cache_file)
+
+
+@lru_cache(maxsize=None)
+def _docker_compose_version(docker_compose):
+    """Return the docker-compose version as a list of numbers (or None)."""
+    result = run_cmd(list(docker_compose) + ["version"])
+    return _parse_version(result.output)
 
 
 class DockerHelper(object):
     """Utility class to interact with docker-compose."""
 
-    def __init__(self, project_shortname, local=True, log_config=None):
-        """Constructor."""
+    def __init__(
+        self, project_shortname, local=True, log_config=None, docker_client=None
+    ):
+        """Constructor.
+
+        :param docker_client: docker client to use, defaults to the shared one.
+        """
         super().__init__()
         self.docker_compose = ["docker", "compose"]
-        self.container_prefix = self._normalize_name(project_shortname)
+        self.project_shortname = project_shortname
         self.local = local
-        self.docker_client = docker.from_env()
+        self.compose_file = (
+            "docker-compose.yml" if self.local else "docker-compose.full.yml"
+        )
+        self._docker_client = docker_client
+        self._pull_process = None
+        self._compose_config = None
+
+    @property
+    def docker_client(self):
+        """Docker client, resolved on first use."""
+        if self._docker_client is None:
+            self._docker_client = get_docker_client()
+        return self._docker_client
+
+    @cached_property
+    def container_prefix(self):
+        """Prefix of the project's container names, resolved on first use."""
+        return self._normalize_name(self.project_shortname)
 
     def _normalize_name(self, project_shortname):
         """Normalize the container name according to the compose version.
@@ -37,29 +121,141 @@ class DockerHelper(object):
         Docker-Compose introduced support for dash and underscore in
         version 1.21.0.
         """
-        dc_version_string = run_cmd(self.docker_compose + ["version"])
-        groups = re.search(r"[0-9].[0-9]*.[0-9]*", dc_version_string.output)
-        dc_version = groups.group(0)
+        dc_version = _docker_compose_version(tuple(self.docker_compose))
 
-        if dc_version < DOCKER_COMPOSE_VERSION_DASH:
+        if dc_version and dc_version < _parse_version(DOCKER_COMPOSE_VERSION_DASH):
             return re.sub(r"[^a-z0-9]", "", project_shortname)
         else:
             return project_shortname
 
     def _get_container_from_service(self, service_name):
         """Retrieve the docker container for the given service_name."""
-        container_name = [
-            container.name
-            for container in self.docker_client.containers.list()
-            if container.name.startswith(self.container_prefix)
-            and service_name in container.name
-        ]
+        # Filter on the label set by docker-compose so that the daemon does
+        # the lookup, and reuse the listed object instead of fetching it again
+        containers = self.docker_client.containers.list(
+            filters={"label": f"com.docker.compose.service={service_name}"}
+        )
+        for container in containers:
+            if container.name.startswith(self.container_prefix):
+                return container
+
+        return None
+
+    def _compose_files_mtimes(self):
+        """Return the modification time (in ns) of the compose files."""
+        compose_files = [self.compose_file, "docker-services.yml", ".env"]
+        return {
+            path: os.stat(path).st_mtime_ns
+            for path in compose_files
+            if os.path.exists(path)
+        }
 
-        return (
-            self.docker_client.containers.get(container_name[0])
-            if container_name
-            else None
+    def _compose_environment(self):
+        """Return a hash of the environment the compose configuration uses.
+
+        That is the variables interpolated in the compose files, plus the
+        ones compose reads itself (e.g. `COMPOSE_PROJECT_NAME`). Values are
+        hashed, as they can be credentials.
+        """
+        names = set()
+        for path in self._compose_files_mtimes():
+            with open(path) as compose_file:
+                names.update(_COMPOSE_VARIABLE_RE.findall(compose_file.read()))
+        names.update(name for name in os.environ if name.startswith("COMPOSE_"))
+        environment = {name: os.environ.get(name) for name in sorted(names)}
+        return hashlib.sha256(json.dumps(environment).encode("utf-8")).hexdigest()
+
+    def get_compose_config(self):
+        """Return the resolved docker-compose configuration as a dict.
+
+        The output of `docker compose config` is cached in the user's cache
+        directory until any of the compose files or the environment they use
+        changes.
+        """
+        if self._compose_config is None:
+            mtimes = self._compose_files_mtimes()
+            environment = self._compose_environment()
+            cache_path = _cache_path("compose-config")
+            cache = _read_json(cache_path)
+
+            cached = cache.get(self.compose_file, {})
+            if (
+                cached.get("mtimes") == mtimes
+                and cached.get("environment") == environment
+            ):
+                self._compose_config = cached["config"]
+                return self._compose_config
+
+            command = self.docker_compose + [
+                "--file",
+                self.compose_file,
+                "config",
+                "--format",
+                "json",
+            ]
+            result = run_cmd(command)
+            if result.status_code > 0:
+                return {}
+            self._compose_config = json.loads(result.output)
+
+            cache[self.compose_file] = {
+                "mtimes": mtimes,
+                "environment": environment,
+                "config": self._compose_config,
+            }
+            try:
+                _write_private_json(cache_path, cache)
+            except OSError:
+                pass  # not being able to cache is not an error
+
+        return self._compose_config
+
+    def pull_images(self):
+        """Pull the images of the services that are not built locally.
+
+        Images are pulled concurrently, so that their layers are downloaded
+        in parallel.
+        """
+        services = self.get_compose_config().get("services", {})
+        images = sorted(
+            {
+                service["image"]
+                for service in services.values()
+                if "image" in service and "build" not in service
+            }
         )
+        if not images:
+            return ProcessResponse(output="No images to pull.", status_code=0)
+
+        from docker.errors import DockerException
+
+        # NOTE: Resolve the client once, not concurrently from the threads
+        try:
+            client = self.docker_client
+        except DockerException as e:
+            return ProcessResponse(error=f"Docker not reachable: {e}", status_code=1)
+
+        def _pull(image):
+            # NOTE: Errors (e.g. a failed layer download) are reported in the
+            # progress stream, not by the HTTP status, so it is read to the end
+            try:
+                errors = [
+                    progress["error"]
+                    for progress in client.api.pull(image, stream=True, decode=True)
+                    if "error" in progress
+                ]
+            except DockerException as e:
+                return f"{image}: {e}"
+            if errors:
+                return f"{image}: {'; '.join(errors)}"
+
+        with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+            errors = [error for error in executor.map(_pull, images) if error]
+
+        if errors:
+            return ProcessResponse(error="\n".join(errors), status_code=1)
+
+        return ProcessResponse(output=f"Pulled {len(images)} images.", status_code=0)
 
     def build_images(self, pull=False, cache=True):
         """Build images.
@@ -80,28 +276,163 @@ class DockerHelper(object):
         # FIXME: To get real-time output
         return run_interactive(command)
 
-    def start_containers(self, app_only=False):
+    def start_containers(self, app_only=False, build=False, pull=False):
         """Start containers according to the specified environment.
 
         :param app_only: Boot up only ui and api containers.
+        :param build: Build images before starting containers, within the
+                      same docker-compose invocation.
+        :param pull: Pull newer versions of the images (including the base
+                     images of the built ones) before starting containers.
         """
         command = self.docker_compose + [
             "--file",
-            "docker-compose.yml" if self.local else "docker-compose.full.yml",
+            self.compose_file,
             "up",
-            "-d",  # --detach not supported in 1.17.0
         ]
 
+        if build:
+            command.append("--build")
+        if pull:
+            command.extend(["--pull", "always"])
+
+        command.append("-d")  # --detach not supported in 1.17.0
+
         if app_only:
             command.extend(["web-ui", "web-api"])
 
-        return run_cmd(command)
+        if build:
+            # Building can take a while, show its output in real time
+            response = run_interactive(command)
+        else:
+            response = run_cmd(command)
+
+        if response.status_code == 0:
+            self._record_services_up(["web-ui", "web-api"] if app_only else None)
+
+        return response
+
+    def _services_config_hashes(self):
+        """Return a hash of each service's resolved configuration."""
+        services = self.get_compose_config().get("services", {})
+        return {
+            service: hashlib.sha256(
+                json.dumps(definition, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+            for service, definition in services.items()
+        }
+
+    def _record_services_up(self, services=None):
+        """Remember the configuration the services were (re)created with.
+
+        :param services: Services brought up, defaults to all of them.
+        """
+        hashes = self._services_config_hashes()
+        if services is not None:
+            hashes = {s: h for s, h in hashes.items() if s in services}
+
+        state_path = _cache_path("compose-up")
+        state = _read_json(state_path)
+        state.setdefault(self.compose_file, {}).update(hashes)
+        try:
+            _write_private_json(state_path, state)
+        except OSError:
+            pass  # not being able to record it only disables the shortcut
+
+    def containers_up_to_date(self):
+        """Checks if all services have a running, up to date, container.
+
+        Containers count as up to date when their service's configuration
+        did not change since the last `up` run by the CLI, and they run the
+        service's current image (e.g. not one replaced by a build or a pull),
+        in which case `up` would not recreate them.
+        """
+        config = self.get_compose_config()
+        services = set(config.get("services", {}))
+        if not services or not config.get("name"):
+            return False
+
+        from docker.errors import DockerException
+
+        try:
+            containers = self.docker_client.api.containers(
+                filters={"label": f"com.docker.compose.project={config['name']}"}
+            )
+        except DockerException:
+            return False
+
+        running = {
+            container["Labels"].get("com.docker.compose.service")
+            for container in containers
+        }
+        if not services <= running:
+            return False
+
+        up_hashes = _read_json(_cache_path("compose-up")).get(self.compose_file, {})
+        if any(
+            up_hashes.get(service) != config_hash
+            for service, config_hash in self._services_config_hashes().items()
+        ):
+            return False
+
+        image_ids = {}
+        try:
+            for service, definition in config["services"].items():
+                # Built services without an explicit image get compose's default
+                image = definition.get("image") or f"{config['name']}-{service}"
+                image_ids[service] = self.docker_client.api.inspect_image(image)["Id"]
+        except DockerException:
+            return False
+
+        return all(
+            container.get("ImageID")
+            == image_ids.get(container["Labels"].get("com.docker.compose.service"))
+            for container in containers
+        )
+
+    def pull_images_in_background(self):
+        """Start pulling the services' images without waiting for it.
+
+        Meant to overlap the download with other slow steps (e.g. locking);
+        use `wait_for_images_pull` to collect the result.
+        """
+        command = self.docker_compose + [
+            "--file",
+            self.compose_file,
+            "pull",
+            "--quiet",
+            "--ignore-buildable",
+            "--ignore-pull-failures",
+        ]
+        self._pull_process = popen(command, stdout=DEVNULL, stderr=PIPE)
+        # Do not leave the pull behind if the CLI exits early (e.g. a failed step)
+        atexit.register(self._stop_images_pull)
+
+        return ProcessResponse(output="Pulling images in the background.")
+
+    def _stop_images_pull(self):
+        """Terminate the background pull, if still running."""
+        if self._pull_process is not None and self._pull_process.poll() is None:
+            self._pull_process.terminate()
+            self._pull_process.wait()
+
+    def wait_for_images_pull(self):
+        """Wait for the pull started by `pull_images_in_background`."""
+        if self._pull_process is None:
+            return ProcessResponse()
+
+        _, error = self._pull_process.communicate()
+        status_code = self._pull_process.returncode
+        self._pull_process = None
+        atexit.unregister(self._stop_images_pull)
+
+        return ProcessResponse(error=error.decode("utf-8"), status_code=status_code)
 
     def stop_containers(self):
         """Stop currently running containers."""
         command = self.docker_compose + [
             "--file",
-            "docker-compose.yml" if self.local else "docker-compose.full.yml",
+            self.compose_file,
             "stop",
         ]
         return run_cmd(command)
@@ -110,7 +441,7 @@ class DockerHelper(object):
         """Stop and remove all containers, volumes and images."""
         command = self.docker_compose + [
             "--file",
-            "docker-compose.yml" if self.local else "docker-compose.full.yml",
+            self.compose_file,
             "down",
             "--volumes",
         ]
@@ -121,9 +452,10 @@ class DockerHelper(object):
         """Execute an invenio CLI command in the API container."""
         container = self._get_container_from_service("web-ui")
         if container:
+            # NOTE: bash is still needed to expand variables in the command
             status = container.exec_run(
-                cmd='/bin/bash -c "{}"'.format(command.replace('"', '\\"')),
-                tty=True,
+                cmd=["/bin/bash", "-c", command],
+                tty=False,
                 stdout=True,
                 stderr=True,
             )
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI output helper."""
+
+import click
+
+QUIET_META_KEY = "invenio_cli.quiet"
+
+
+def is_quiet():
+    """Checks if progress messages should be omitted (``--quiet``)."""
+    ctx = click.get_current_context(silent=True)
+    return bool(ctx and ctx.meta.get(QUIET_META_KEY))
+
+
+def secho_progress(message, **styles):
+    """Echo a progress message, unless ``--quiet`` was given.
+
+    Warnings and errors should keep using ``click.secho`` directly.
+    """
+    if not is_quiet():
+        click.secho(message=message, **styles)
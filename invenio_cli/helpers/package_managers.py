@@ -24,6 +24,7 @@ class PythonPackageManager(ABC):
 
     name: str = None
     lock_file_name: str = None
+    manifest_file_name: str = None
 
     def run_command(self, *command: str) -> List[str]:
         """Generate command to run the given command in the managed environment."""
@@ -67,6 +68,7 @@ class Pipenv(PythonPackageManager):
 
     name = "pipenv"
     lock_file_name = "Pipfile.lock"
+    manifest_file_name = "Pipfile"
 
     def run_command(self, *command):
         """Generate command to run the given command in the managed environment."""
@@ -124,6 +126,7 @@ class UV(PythonPackageManager):
 
     name = "uv"
     lock_file_name = "uv.lock"
+    manifest_file_name = "pyproject.toml"
 
     def run_command(self, *command):
         """Generate command to run the given command in the managed environment."""
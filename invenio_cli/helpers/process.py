@@ -10,7 +10,8 @@
 
 """Invenio CLI Process helper module."""
 
-from os import environ
+import sys
+from os import environ, execvpe
 from subprocess import PIPE, CalledProcessError
 from subprocess import Popen as popen
 from subprocess import run
@@ -68,3 +69,22 @@ def run_interactive(command, env=None, skippable=False, log_file=None):
     finally:
         if stdout:
             stdout.close()
+
+
+def replace_process(command, env=None):
+    """Replaces the current process with the given command.
+
+    Meant for commands that are the last action of the CLI (e.g. shells), it
+    saves keeping the Python process around while waiting. It does not
+    return.
+    :param command: The command to run, in array form.
+    :param env: A dict of variables to add to the environment.
+    """
+    full_env = environ.copy()
+    if env:
+        full_env.update(env)
+
+    # Buffered output would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+    execvpe(command[0], command, full_env)
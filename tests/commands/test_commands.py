@@ -50,3 +50,13 @@ def test_destroy(p_docker_helper, p_run_cmd, mock_cli_config):
     p_run_cmd.assert_called_with(["pipenv", "--rm"])
     commands.docker_helper.destroy_containers.assert_called()
     assert mock_cli_config.services_setup is False
+
+
+@patch("invenio_cli.commands.commands.replace_process")
+def test_pyshell_replaces_process(p_replace_process, mock_cli_config):
+    Commands(mock_cli_config).pyshell(debug=True)
+
+    p_replace_process.assert_called_once_with(
+        ["pipenv", "run", "invenio", "shell"],
+        env={"PIPENV_VERBOSITY": "-1", "FLASK_DEBUG": "1"},
+    )
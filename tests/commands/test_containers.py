@@ -9,7 +9,7 @@
 """Module commands/containers.py's tests."""
 
 from pathlib import Path
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -225,3 +225,71 @@ def test_demo(p_run_cmd, p_docker_helper, mock_cli_config):
     assert commands.docker_helper.execute_cli_command.mock_calls == [
         call("project-shortname", "invenio rdm-records demo")
     ]
+
+
+def test_start_build_uses_single_up(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    steps = commands.start(build=True)
+
+    assert len(steps) == 2
+    assert steps[-1].func == commands.docker_helper.start_containers
+    assert steps[-1].args == {"app_only": False, "build": True, "pull": True}
+    assert commands.docker_helper.build_images not in [s.func for s in steps]
+
+
+def test_start_build_and_setup_builds_first(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    with patch("invenio_cli.commands.containers.rdm_version", return_value=[12]):
+        steps = commands.start(build=True, setup=True)
+
+    assert steps[1].func == commands.docker_helper.pull_images
+    assert steps[2].func == commands.docker_helper.build_images
+
+
+def test_start_lock_pulls_images_meanwhile(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    steps = commands.start(lock=True, force_lock=True)
+    funcs = [getattr(s, "func", None) for s in steps]
+
+    assert funcs[0] == commands.docker_helper.pull_images_in_background
+    assert funcs[-2] == commands.docker_helper.wait_for_images_pull
+    assert funcs[-1] == commands.docker_helper.start_containers
+
+
+def test_start_lock_build_setup_pulls_once(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    with patch("invenio_cli.commands.containers.rdm_version", return_value=[12]):
+        steps = commands.start(lock=True, build=True, setup=True, force_lock=True)
+    funcs = [getattr(s, "func", None) for s in steps]
+
+    assert commands.docker_helper.pull_images_in_background in funcs
+    assert commands.docker_helper.pull_images not in funcs
+    assert commands.docker_helper.build_images in funcs
+
+
+def test_start_lock_up_to_date_does_not_pull(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    with patch(
+        "invenio_cli.commands.containers.PackagesCommands.is_lock_up_to_date",
+        return_value=True,
+    ):
+        steps = commands.start(lock=True)
+    funcs = [getattr(s, "func", None) for s in steps]
+
+    assert commands.docker_helper.pull_images_in_background not in funcs
+    assert commands.docker_helper.wait_for_images_pull not in funcs
+
+
+def test_start_lock_build_leaves_pull_to_up(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    steps = commands.start(lock=True, build=True, force_lock=True)
+    funcs = [getattr(s, "func", None) for s in steps]
+
+    assert commands.docker_helper.pull_images_in_background not in funcs
+    assert steps[-1].args["pull"]
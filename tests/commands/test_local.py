@@ -451,3 +451,25 @@ def test_run_worker_version_below_13(p_popen, p_rdm_version, mock_cli_config):
     assert "worker" in called_command
     assert "--beat" in called_command
     assert "--scheduler" not in called_command
+
+
+@patch("invenio_cli.commands.local.signal.getsignal", return_value=None)
+@patch("invenio_cli.commands.local.signal.signal")
+@patch("invenio_cli.commands.local.rdm_version")
+@patch("invenio_cli.commands.local.popen")
+def test_run_all_single_sigint_handler(
+    p_popen, p_rdm_version, p_signal, p_getsignal, mock_cli_config
+):
+    """Test run_all installs one SIGINT handler stopping all processes."""
+    commands = LocalCommands(mock_cli_config)
+    p_popen.side_effect = lambda *args, **kwargs: MagicMock()
+    p_rdm_version.return_value = [13, 0, 0]
+
+    processes = commands.run_all(host="127.0.0.1", port="5000")
+
+    assert len(processes) == 3
+    p_signal.assert_called_once()
+    handler = p_signal.call_args[0][1]
+    handler(None, None)
+    for proc in processes:
+        proc.terminate.assert_called_once()
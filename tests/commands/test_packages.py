@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module commands/packages.py's tests."""
+
+import os
+
+from invenio_cli.commands import PackagesCommands
+from invenio_cli.commands.steps import CommandStep, FunctionStep
+
+
+def test_lock_skipped_when_up_to_date(mock_cli_config, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pkg_man = mock_cli_config.python_package_manager
+    pkg_man.lock_file_name = "Pipfile.lock"
+    pkg_man.manifest_file_name = "Pipfile"
+    commands = PackagesCommands(mock_cli_config)
+
+    # No lock file yet
+    (tmp_path / "Pipfile").touch()
+    assert not commands.is_lock_up_to_date()
+    assert isinstance(commands.lock(False, False, force=False)[0], CommandStep)
+
+    # Lock file newer than the manifest
+    (tmp_path / "Pipfile.lock").touch()
+    os.utime(tmp_path / "Pipfile", (0, 0))
+    assert commands.is_lock_up_to_date()
+    steps = commands.lock(False, False, force=False)
+    assert isinstance(steps[0], FunctionStep)
+    assert steps[0].execute().status_code == 0
+
+    # Forced locking
+    assert isinstance(commands.lock(False, False)[0], CommandStep)
@@ -119,3 +119,24 @@ def test_cli_config_get_project_shortname(config_dir):
     cli_config = CLIConfig(config_dir)
 
     assert cli_config.get_project_shortname() == "my-site"
+
+
+def test_cli_config_cached_parse(config_dir):
+    cli_config = CLIConfig(config_dir)
+    assert CLIConfig(config_dir).config is cli_config.config
+
+    # Touching the file invalidates the cached parse
+    config_path = config_dir / CLIConfig.CONFIG_FILENAME
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert CLIConfig(config_dir).config is not cli_config.config
+
+
+def test_cli_config_missing_private_config(config_dir):
+    private_config_path = config_dir / CLIConfig.PRIVATE_CONFIG_FILENAME
+    private_config_path.unlink()
+
+    cli_config = CLIConfig(config_dir)
+
+    assert private_config_path.is_file()
+    assert cli_config.get_services_setup() is False
@@ -38,3 +38,14 @@ def test_extract_template_name_path():
     )
 
     assert tpl_name == "cookiecutter-invenio-rdm"
+
+
+def test_constructor_flavour_defaults():
+    cookiecutter = CookiecutterWrapper("ils")
+
+    assert (
+        cookiecutter.template
+        == "https://github.com/inveniosoftware/cookiecutter-invenio-ils.git"
+    )
+    assert cookiecutter.template_name == "cookiecutter-invenio-ils"
+    assert cookiecutter.checkout == "v1.0.0rc.1"
@@ -9,11 +9,28 @@
 
 """Module docker_helper tests."""
 
-from unittest.mock import patch
+import json
+import os
+from unittest.mock import Mock, patch
 
 import pytest
+from docker.errors import DockerException
 
-from invenio_cli.helpers.docker_helper import DockerHelper
+from invenio_cli.commands.steps import FunctionStep
+from invenio_cli.helpers.docker_helper import (
+    DockerHelper,
+    _cache_path,
+    _docker_compose_version,
+)
+from invenio_cli.helpers.process import ProcessResponse
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(tmp_path, monkeypatch):
+    """Keep the files cached by the helper out of the user's cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    return cache_dir
 
 
 @pytest.mark.skip()
@@ -50,3 +67,279 @@ def test_start_containers(p_run_cmd):
             "-d",
         ]
     )
+
+
+@patch("invenio_cli.helpers.docker_helper._docker_client", None)
+@patch("docker.from_env")
+def test_docker_client_is_shared(p_from_env):
+    first = DockerHelper("project-shortname", local=True)
+    second = DockerHelper("project-shortname", local=False)
+    p_from_env.assert_not_called()
+
+    assert first.docker_client is second.docker_client
+    p_from_env.assert_called_once()
+
+
+@patch("invenio_cli.helpers.docker_helper.popen")
+def test_images_pull_in_background(p_popen):
+    p_popen.return_value.communicate.return_value = (None, b"")
+    p_popen.return_value.returncode = 0
+    docker_helper = DockerHelper("project-shortname", local=True)
+
+    assert docker_helper.wait_for_images_pull().status_code == 0
+    p_popen.assert_not_called()
+
+    docker_helper.pull_images_in_background()
+    assert p_popen.call_args[0][0][-4:] == [
+        "pull",
+        "--quiet",
+        "--ignore-buildable",
+        "--ignore-pull-failures",
+    ]
+    assert docker_helper.wait_for_images_pull().status_code == 0
+    p_popen.return_value.communicate.assert_called_once()
+
+
+def test_get_container_from_service():
+    docker_client = Mock()
+    other, container = Mock(), Mock()
+    other.name = "other-project-web-ui-1"
+    container.name = "project-shortname-web-ui-1"
+    docker_client.containers.list.return_value = [other, container]
+    docker_helper = DockerHelper("project-shortname", docker_client=docker_client)
+    # Not resolved from the docker compose version
+    docker_helper.container_prefix = "project-shortname"
+
+    assert docker_helper._get_container_from_service("web-ui") is container
+    docker_client.containers.list.assert_called_once_with(
+        filters={"label": "com.docker.compose.service=web-ui"}
+    )
+    docker_client.containers.get.assert_not_called()
+
+    docker_client.containers.list.return_value = []
+    assert docker_helper._get_container_from_service("web-ui") is None
+
+
+def test_execute_cli_command():
+    container = Mock()
+    container.name = "project-shortname-web-ui-1"
+    container.exec_run.return_value.output = b"output\n"
+    container.exec_run.return_value.exit_code = 0
+    docker_client = Mock()
+    docker_client.containers.list.return_value = [container]
+    docker_helper = DockerHelper("project-shortname", docker_client=docker_client)
+    # Not resolved from the docker compose version
+    docker_helper.container_prefix = "project-shortname"
+
+    command = 'invenio shell -c "print(1)" ${INVENIO_INSTANCE_PATH}'
+    response = docker_helper.execute_cli_command("project-shortname", command)
+
+    assert response.output == "output"
+    assert response.status_code == 0
+    container.exec_run.assert_called_once_with(
+        cmd=["/bin/bash", "-c", command], tty=False, stdout=True, stderr=True
+    )
+
+
+@patch("invenio_cli.helpers.docker_helper.run_cmd")
+def test_pull_images(p_run_cmd, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    p_run_cmd.return_value = ProcessResponse(
+        output=json.dumps(
+            {
+                "services": {
+                    "web-ui": {"image": "project-shortname", "build": {}},
+                    "db": {"image": "postgres:14"},
+                    "cache": {"image": "redis:7"},
+                    "worker": {"image": "redis:7"},
+                }
+            }
+        )
+    )
+    docker_client = Mock()
+    docker_client.api.pull.return_value = [{"status": "Pull complete"}]
+    docker_helper = DockerHelper("project-shortname", docker_client=docker_client)
+
+    response = docker_helper.pull_images()
+
+    assert response.status_code == 0
+    assert sorted(c.args[0] for c in docker_client.api.pull.mock_calls) == [
+        "postgres:14",
+        "redis:7",
+    ]
+    # The compose configuration is only computed once
+    docker_helper.pull_images()
+    p_run_cmd.assert_called_once()
+
+    # Errors reported in the progress stream fail the pull
+    docker_client.api.pull.side_effect = lambda image, **kwargs: iter(
+        [{"status": "Downloading"}, {"error": "layer download failed"}]
+    )
+    response = docker_helper.pull_images()
+
+    assert response.status_code == 1
+    assert "redis:7: layer download failed" in response.error
+
+
+@patch("invenio_cli.helpers.docker_helper.run_cmd")
+def test_containers_up_to_date(p_run_cmd, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docker-compose.yml").touch()
+    services = {"db": {"image": "postgres"}, "cache": {"build": "."}}
+    p_run_cmd.side_effect = lambda command: ProcessResponse(
+        output=json.dumps({"name": "project", "services": services}),
+        status_code=0,
+    )
+    docker_client = Mock()
+    images = {"postgres": {"Id": "sha256:db"}, "project-cache": {"Id": "sha256:cache"}}
+    docker_client.api.inspect_image.side_effect = lambda image: images[image]
+
+    def _helper():
+        return DockerHelper("project-shortname", docker_client=docker_client)
+
+    def _container(service):
+        labels = {"com.docker.compose.service": service}
+        image_id = images["postgres" if service == "db" else "project-cache"]["Id"]
+        return {"Labels": labels, "ImageID": image_id}
+
+    docker_client.api.containers.return_value = [_container("db")]
+    _helper().start_containers()
+
+    # A service is not running
+    assert not _helper().containers_up_to_date()
+
+    # All services running with the configuration of the last `up`
+    docker_client.api.containers.return_value.append(_container("cache"))
+    assert _helper().containers_up_to_date()
+
+    # Editing the compose files without changing the services, e.g. a comment
+    (tmp_path / "docker-compose.yml").write_text("# services\n")
+    assert _helper().containers_up_to_date()
+
+    # An image was rebuilt (or pulled) after the container was created
+    images["project-cache"] = {"Id": "sha256:rebuilt"}
+    assert not _helper().containers_up_to_date()
+    images["project-cache"] = {"Id": "sha256:cache"}
+
+    # A service's configuration changed since the last `up`
+    services["db"]["environment"] = {"POSTGRES_DB": "other"}
+    (tmp_path / "docker-compose.yml").write_text("# db environment\n")
+    assert not _helper().containers_up_to_date()
+    _helper().start_containers()
+    assert _helper().containers_up_to_date()
+
+
+@patch("invenio_cli.helpers.docker_helper.run_cmd")
+def test_compose_config_cache(p_run_cmd, tmp_path, monkeypatch, user_cache_dir):
+    monkeypatch.chdir(tmp_path)
+    compose_file = tmp_path / "docker-compose.yml"
+    compose_file.touch()
+    p_run_cmd.return_value = ProcessResponse(
+        output=json.dumps({"name": "project", "services": {"db": {}}})
+    )
+
+    config = DockerHelper("project-shortname").get_compose_config()
+    assert config["name"] == "project"
+    # Cached outside of the project, only readable by the user
+    cache_path = _cache_path("compose-config")
+    assert cache_path.startswith(str(user_cache_dir))
+    assert os.stat(cache_path).st_mode & 0o777 == 0o600
+
+    # Another invocation reuses the cached configuration
+    assert DockerHelper("project-shortname").get_compose_config() == config
+    p_run_cmd.assert_called_once()
+
+    # Changing a compose file invalidates the cache
+    stat = compose_file.stat()
+    os.utime(compose_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    DockerHelper("project-shortname").get_compose_config()
+    assert p_run_cmd.call_count == 2
+
+    # So does changing a variable interpolated in the compose files
+    compose_file.write_text("services:\n  db:\n    image: postgres:${PG_TAG}\n")
+    DockerHelper("project-shortname").get_compose_config()
+    assert p_run_cmd.call_count == 3
+    monkeypatch.setenv("PG_TAG", "s3cr3t")
+    DockerHelper("project-shortname").get_compose_config()
+    assert p_run_cmd.call_count == 4
+    DockerHelper("project-shortname").get_compose_config()
+    assert p_run_cmd.call_count == 4
+    # Only a hash of the environment values is stored
+    with open(cache_path) as cache_file:
+        assert "s3cr3t" not in cache_file.read()
+
+
+@pytest.mark.parametrize(
+    "version_output,prefix",
+    [
+        ("docker-compose version 1.3.0, build abc", "projectshortname"),
+        ("Docker Compose version v2.17.3", "project-shortname"),
+    ],
+)
+@patch("invenio_cli.helpers.docker_helper.run_cmd")
+def test_container_prefix(p_run_cmd, version_output, prefix):
+    _docker_compose_version.cache_clear()
+    p_run_cmd.return_value = ProcessResponse(output=version_output)
+
+    docker_helper = DockerHelper("project-shortname")
+    p_run_cmd.assert_not_called()
+
+    assert docker_helper.container_prefix == prefix
+    assert DockerHelper("project-shortname").container_prefix == prefix
+    p_run_cmd.assert_called_once()
+    _docker_compose_version.cache_clear()
+
+
+@patch("invenio_cli.helpers.docker_helper.run_interactive")
+def test_start_containers_build_and_pull(p_run_interactive):
+    docker_helper = DockerHelper("project-shortname", local=False)
+
+    docker_helper.start_containers(build=True, pull=True)
+
+    p_run_interactive.assert_called_once_with(
+        [
+            "docker",
+            "compose",
+            "--file",
+            "docker-compose.full.yml",
+            "up",
+            "--build",
+            "--pull",
+            "always",
+            "-d",
+        ]
+    )
+
+
+@patch("invenio_cli.helpers.docker_helper.run_cmd")
+@patch("invenio_cli.helpers.docker_helper.get_docker_client")
+def test_pull_images_docker_unreachable(
+    p_get_docker_client, p_run_cmd, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    p_get_docker_client.side_effect = DockerException("unreachable")
+    p_run_cmd.return_value = ProcessResponse(
+        output=json.dumps({"services": {"db": {"image": "postgres:14"}}})
+    )
+    docker_helper = DockerHelper("project-shortname")
+
+    step = FunctionStep(func=docker_helper.pull_images, skippable=True)
+    response = step.execute()
+
+    assert response.status_code == 0
+    assert response.warning
+    p_get_docker_client.assert_called_once()
+
+
+@patch("invenio_cli.helpers.docker_helper.atexit")
+@patch("invenio_cli.helpers.docker_helper.popen")
+def test_images_pull_stopped_on_exit(p_popen, p_atexit):
+    p_popen.return_value.poll.return_value = None
+    docker_helper = DockerHelper("project-shortname", local=True)
+
+    docker_helper.pull_images_in_background()
+    stop = p_atexit.register.call_args[0][0]
+
+    # e.g. the lock step failed and the CLI exits before waiting
+    stop()
+    p_popen.return_value.terminate.assert_called_once()
@@ -10,10 +10,15 @@
 
 from os.path import exists
 
+import click
 import pytest
 from click.testing import CliRunner
 
 from invenio_cli.cli import cli
+from invenio_cli.cli.utils import QUIET_META_KEY, handle_process_response, run_steps
+from invenio_cli.commands.steps import FunctionStep
+from invenio_cli.helpers.output import secho_progress
+from invenio_cli.helpers.process import ProcessResponse
 
 
 @pytest.fixture()
@@ -40,3 +45,52 @@ def test_init_with_arg(runner):
     assert result.exit_code == 0
     assert exists("my-site")
     assert exists("my-site/.invenio")
+
+
+def test_handle_process_response_failure():
+    """Test a failed process response exits through click."""
+
+    @click.command()
+    def failing():
+        handle_process_response(
+            ProcessResponse(error="boom", status_code=2), fail_message="Failed."
+        )
+
+    result = CliRunner().invoke(failing)
+    assert result.exit_code == 1
+    assert "Failed.\nErrors: boom" in result.output
+
+
+def test_quiet_run_steps():
+    """Test --quiet hides progress messages but not warnings."""
+
+    @click.group()
+    @click.option("--quiet", "-q", is_flag=True)
+    @click.pass_context
+    def group(ctx, quiet):
+        ctx.meta[QUIET_META_KEY] = quiet
+
+    @group.command()
+    def steps():
+        secho_progress("Starting...", fg="green")
+        run_steps(
+            [
+                FunctionStep(
+                    func=lambda: ProcessResponse(output="Done."), message="Doing..."
+                ),
+                FunctionStep(
+                    func=lambda: ProcessResponse(output="Careful.", warning=True),
+                    message="Warning...",
+                ),
+            ],
+            "Failed.",
+            "Success.",
+        )
+
+    result = CliRunner().invoke(group, ["steps"])
+    assert result.output == (
+        "Starting...\nDoing...\nDone.\nWarning...\nOutput: Careful.\nSuccess.\n"
+    )
+
+    result = CliRunner().invoke(group, ["-q", "steps"])
+    assert result.output == "Output: Careful.\n"